@@ -1,9 +1,9 @@
 import streamlit as st
 import json
-import random
 import os
 from PIL import Image
 import base64
+from rng_streams import derive_stream, new_root_seed
 
 # import plotly.express as px
 img = Image.open("img/I4Data.png")
@@ -11,6 +11,19 @@ img_bio = Image.open("img/bio_photo.jpg")
 def show_text(text):
     st.markdown(f'<p class="font">{text}</p>', unsafe_allow_html=True)
 # -----------------------
+# RNG streams
+# -----------------------
+TEXT_COLORS = ["#FF5733","#33FF57","#3380FF","#FF33EC","#FFC300"]
+BG_COLORS = ["#F0F8FF","#FFFACD","#E6E6FA","#F5F5DC","#FFE4E1"]
+
+def pick_colors(rng):
+    text_color = rng.choice(TEXT_COLORS)
+    bg_color = rng.choice(BG_COLORS)
+    while text_color == bg_color:
+        bg_color = rng.choice(BG_COLORS)
+    return text_color, bg_color
+
+# -----------------------
 # File paths
 # -----------------------
 FARSI_FILE = "farsi_words.json"
@@ -84,6 +97,10 @@ if "farsi_words" not in st.session_state:
     st.session_state.farsi_words = load_words(FARSI_FILE, default_farsi)
 if "english_words" not in st.session_state:
     st.session_state.english_words = load_words(EN_FILE, default_english)
+if "root_seed" not in st.session_state:
+    st.session_state.root_seed = new_root_seed()
+    st.session_state.rng = derive_stream(st.session_state.root_seed, "session")
+    st.session_state.game_index = 0
 
 # -----------------------
 # Page setup
@@ -100,6 +117,24 @@ if lang == "Farsi":
 else:
     words_dict = st.session_state.english_words
 
+# -----------------------
+# Seed (replay a session or game by entering its seed)
+# -----------------------
+# Locked while a game is running so its caption always names a replayable game
+game_running = "groups" in st.session_state
+with st.sidebar.form("seed_form"):
+    seed_text = st.text_input("🎲 Seed / بذر:", value=str(st.session_state.root_seed), disabled=game_running)
+    apply_seed = st.form_submit_button("Apply Seed / اعمال بذر", disabled=game_running)
+if apply_seed:
+    if seed_text.strip().isdecimal():
+        # Re-applying the current seed restarts the session from its first draw
+        st.session_state.root_seed = int(seed_text.strip())
+        st.session_state.rng = derive_stream(st.session_state.root_seed, "session")
+        st.session_state.game_index = 0
+    else:
+        st.sidebar.error("Seed must be a whole number.")
+rng = st.session_state.rng
+
 # -----------------------
 # Sidebar navigation (updated)
 # -----------------------
@@ -121,11 +156,8 @@ if page == "Random Word/Sentence":
     if st.button("🎯 Generate Random"):
         items = words_dict[level][item_type]
         if items:
-            random_item = random.choice(items)
-            text_color = random.choice(["#FF5733","#33FF57","#3380FF","#FF33EC","#FFC300"])
-            bg_color = random.choice(["#F0F8FF","#FFFACD","#E6E6FA","#F5F5DC","#FFE4E1"])
-            while text_color == bg_color:
-                bg_color = random.choice(["#F0F8FF","#FFFACD","#E6E6FA","#F5F5DC","#FFE4E1"])
+            random_item = rng.choice(items)
+            text_color, bg_color = pick_colors(rng)
             st.markdown(
                 f"<div style='text-align:center; font-size:28px; color:{text_color}; "
                 f"background-color:{bg_color}; padding:25px; border-radius:15px; font-weight:bold;'>{random_item}</div>",
@@ -210,20 +242,20 @@ elif page == "Random Letter/Number":
             card_lang = st.radio("Card Language / زبان کارت:", ["English", "Farsi"])
 
     if st.button("🎯 Generate"):
-        text_color = random.choice(["#FF5733","#33FF57","#3380FF","#FF33EC","#FFC300"])
-        bg_color = random.choice(["#F0F8FF","#FFFACD","#E6E6FA","#F5F5DC","#FFE4E1"])
-        while text_color == bg_color:
-            bg_color = random.choice(["#F0F8FF","#FFFACD","#E6E6FA","#F5F5DC","#FFE4E1"])
+        text_color, bg_color = pick_colors(rng)
 
         if option_type == "Letter":
             if lang_choice=="English":
-                random_item = random.choice(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+                random_item = rng.choice(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
             else:
                 farsi_letters = list("ابپتثجچحخدذرزژسشصضطظعغفقکگلمنوهی")
-                random_item = random.choice(farsi_letters)
+                random_item = rng.choice(farsi_letters)
         
         elif option_type == "Number":
-            random_item = random.randint(int(min_val), int(max_val))
+            if min_val > max_val:
+                st.error("Min must not be greater than Max.")
+                st.stop()
+            random_item = rng.randint(int(min_val), int(max_val))
 
         elif option_type == "Card":
             suits_en = ["Spades", "Hearts", "Diamonds", "Clubs"]
@@ -233,12 +265,12 @@ elif page == "Random Letter/Number":
             ranks_fa = ["آس", "۲", "۳", "۴", "۵", "۶", "۷", "۸", "۹", "۱۰", "سرباز", "بی بی", "شاه"]
 
             if card_lang == "English":
-                suit = random.choice(suits_en)
-                rank = random.choice(ranks_en)
+                suit = rng.choice(suits_en)
+                rank = rng.choice(ranks_en)
                 random_item = f"{rank} of {suit}"
             else:
-                suit = random.choice(suits_fa)
-                rank = random.choice(ranks_fa)
+                suit = rng.choice(suits_fa)
+                rank = rng.choice(ranks_fa)
                 random_item = f"{rank} {suit}"
 
         st.markdown(
@@ -257,6 +289,8 @@ elif page == "Play Game":
     # --- Setup groups ---
     if "groups" not in st.session_state:
         num_groups = st.number_input("Enter number of groups:", min_value=1, step=1, value=2)
+        # Pick an earlier game number to replay that game from the current seed
+        game_number = st.number_input("Game number:", min_value=1, step=1, value=st.session_state.game_index + 1)
         if st.button("Start Game"):
             st.session_state.groups = {f"Group {i+1}": 0 for i in range(num_groups)}
             st.session_state.current_group = 0
@@ -266,8 +300,12 @@ elif page == "Play Game":
             st.session_state.started = True
             st.session_state.round_played = {f"Group {i+1}": False for i in range(num_groups)}
             st.session_state.used_items = []  # Track used items to avoid repetition
+            st.session_state.game_index = int(game_number)
+            st.session_state.game_rng = derive_stream(st.session_state.root_seed, "game", st.session_state.game_index)
         st.stop()
 
+    game_rng = st.session_state.game_rng
+    st.caption(f"Game #{st.session_state.game_index} · Seed {st.session_state.root_seed}")
     group_names = list(st.session_state.groups.keys())
     current_group_name = group_names[st.session_state.current_group]
     st.markdown(f"### 🟢 Current Turn: {current_group_name} | Score: {st.session_state.groups[current_group_name]}")
@@ -296,14 +334,14 @@ elif page == "Play Game":
         remaining_items = items.copy()
 
     if st.session_state.current_item == "" or st.session_state.current_item not in remaining_items:
-        st.session_state.current_item = random.choice(remaining_items)
+        st.session_state.current_item = game_rng.choice(remaining_items)
         st.session_state.used_items.append(st.session_state.current_item)
 
     # --- Display current word ---
-    text_color = random.choice(["#FF5733","#33FF57","#3380FF","#FF33EC","#FFC300"])
-    bg_color = random.choice(["#F0F8FF","#FFFACD","#E6E6FA","#F5F5DC","#FFE4E1"])
-    while text_color == bg_color:
-        bg_color = random.choice(["#F0F8FF","#FFFACD","#E6E6FA","#F5F5DC","#FFE4E1"])
+    # Colours redraw on every rerun, so they are keyed by the word count rather than drawn from game_rng
+    color_rng = derive_stream(st.session_state.root_seed, "game", st.session_state.game_index,
+                              "colors", len(st.session_state.used_items), block_size=2)
+    text_color, bg_color = pick_colors(color_rng)
     st.markdown(
         f"<div style='text-align:center; font-size:32px; color:{text_color}; "
         f"background-color:{bg_color}; padding:25px; border-radius:15px; font-weight:bold;'>{st.session_state.current_item}</div>",
@@ -325,7 +363,7 @@ elif page == "Play Game":
             if not remaining_items:
                 st.session_state.used_items = []
                 remaining_items = items.copy()
-            st.session_state.current_item = random.choice(remaining_items)
+            st.session_state.current_item = game_rng.choice(remaining_items)
             st.session_state.used_items.append(st.session_state.current_item)
             st.session_state.round_played[current_group_name] = True
 
@@ -336,7 +374,7 @@ elif page == "Play Game":
             if not remaining_items:
                 st.session_state.used_items = []
                 remaining_items = items.copy()
-            st.session_state.current_item = random.choice(remaining_items)
+            st.session_state.current_item = game_rng.choice(remaining_items)
             st.session_state.used_items.append(st.session_state.current_item)
             st.session_state.round_played[current_group_name] = True
 
@@ -347,7 +385,7 @@ elif page == "Play Game":
             if not remaining_items:
                 st.session_state.used_items = []
                 remaining_items = items.copy()
-            st.session_state.current_item = random.choice(remaining_items)
+            st.session_state.current_item = game_rng.choice(remaining_items)
             st.session_state.used_items.append(st.session_state.current_item)
 
     # --- Finish Game button ---
@@ -357,7 +395,7 @@ elif page == "Play Game":
             for g, s in st.session_state.groups.items():
                 st.write(f"{g}: {s}")
             # Reset game
-            for key in ["groups","current_group","current_item","current_level","current_type","started","round_played","used_items"]:
+            for key in ["groups","current_group","current_item","current_level","current_type","started","round_played","used_items","game_rng"]:
                 del st.session_state[key]
     else:
         st.button("🏁 Finish Game (disabled, all groups must play this round)", disabled=True)
@@ -410,6 +448,10 @@ if page == "How to Use":
     - You can switch **language** anytime from the sidebar.
     - Add new words or sentences to make the game more fun and challenging.
     - Colors and background change randomly for a fun visual experience.
+    - The **Seed** in the sidebar drives every random pick. Enter a seed and click **Apply Seed**
+      to restart the session's random picks from the beginning.
+    - Every game shows its **Game #** and **Seed**. To replay a game, apply its seed, enter its
+      number in **Game number**, and click the same buttons: the words and their colors repeat.
     
     ### Developer
     Hosna Hamdieh
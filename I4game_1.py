@@ -1,9 +1,10 @@
 import streamlit as st
 import json
 import os
-import random
 import binascii
+import zlib
 from PIL import Image
+from rng_streams import derive_stream, deranged_shuffle, new_root_seed
 
 # =========================
 # CONFIG
@@ -29,20 +30,15 @@ def save_rooms(rooms):
         json.dump(rooms, f, indent=2)
 
 # =========================
-# DERANGEMENT FUNCTION
+# RNG STREAMS
 # =========================
-def deranged_shuffle(items):
-    """Shuffle items so that no player receives their own submission."""
-    players = list(items.keys())
-    values = list(items.values())
-    n = len(players)
-    for _ in range(100):  # retry loop
-        shuffled_values = values[:]
-        random.shuffle(shuffled_values)
-        if all(players[i] != shuffled_values[i][0] for i in range(n)):
-            return dict(zip(players, [v[1] for v in shuffled_values]))
-    # Fallback: simple rotation
-    return dict(zip(players, [v[1] for v in values[1:] + values[:1]]))
+def room_seed(room_code, room):
+    """Seed stored at room creation; rooms saved before seeding fall back to one derived from the code."""
+    return room.get("seed", zlib.crc32(room_code.encode("utf-8")))
+
+def assignment_stream(room_code, room):
+    """Stream for the room's current hand-off; reproducible from the room seed, round and phase."""
+    return derive_stream(room_seed(room_code, room), room["round"], room["phase"])
 
 # =========================
 # SESSION STATE
@@ -76,6 +72,7 @@ if page == "Play Game":
                 rooms = load_rooms()
                 if room_code not in rooms:
                     rooms[room_code] = {
+                        "seed": new_root_seed(),
                         "players": [],
                         "phase": "word",
                         "round": 0,
@@ -101,6 +98,7 @@ if page == "Play Game":
     st.subheader(f"Room: {st.session_state.room_code}")
     st.write("Players:", ", ".join(players))
     st.write("Round:", room["round"] + 1)
+    st.caption(f"Seed: {room_seed(st.session_state.room_code, room)}")
 
     # -------------------------
     # END GAME BUTTON (first player)
@@ -131,7 +129,7 @@ if page == "Play Game":
         # All players submitted → assign items for drawing
         if len(room["submissions"]) == len(players):
             items_to_assign = {player: (player, room["submissions"][player]) for player in players}
-            assigned = deranged_shuffle(items_to_assign)
+            assigned = deranged_shuffle(items_to_assign, assignment_stream(st.session_state.room_code, room))
             room["current_items"] = assigned
             room["submissions"] = {}
             room["phase"] = "draw"
@@ -161,7 +159,7 @@ if page == "Play Game":
         # All drawings submitted → assign items for guess
         if len(room["submissions"]) == len(players):
             items_to_assign = {player: (player, room["submissions"][player]) for player in players}
-            assigned = deranged_shuffle(items_to_assign)
+            assigned = deranged_shuffle(items_to_assign, assignment_stream(st.session_state.room_code, room))
             room["current_items"] = assigned
             room["submissions"] = {}
             room["phase"] = "guess"
@@ -190,7 +188,7 @@ if page == "Play Game":
         # All guesses submitted → next round (draw again)
         if len(room["submissions"]) == len(players):
             items_to_assign = {player: (player, room["submissions"][player]) for player in players}
-            assigned = deranged_shuffle(items_to_assign)
+            assigned = deranged_shuffle(items_to_assign, assignment_stream(st.session_state.room_code, room))
             room["current_items"] = assigned
             room["submissions"] = {}
             room["phase"] = "draw"
@@ -229,6 +227,7 @@ if page == "How to Use":
 5. **Rounds continue**: Guesses become the next words for drawing, alternating rounds.
 6. **Game ends**: The first player who joined the room can click **End Game** to see all chains.
 7. **Results**: View each item's full word/drawing/guess chain to see how the original words transformed.
+8. **Replay**: Every hand-off is drawn from the room's seed (shown under the round), so the same seed reproduces the same assignments.
 """)
     st.image(img_bio, caption='Hosna Hamdieh')
     st.markdown("For more info go to my [LinkedIn](https://www.linkedin.com/in/hosna-hamdieh/)")
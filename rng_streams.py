@@ -0,0 +1,81 @@
+import zlib
+import numpy as np
+
+# Floats from the buffer carry 53 random bits; wider ranges are built from 63-bit integer words.
+FLOAT_RANGE_LIMIT = 2 ** 53
+WORD_BITS = 63
+
+
+class RandomStream:
+    """Seeded PCG64 stream; draws are read from a prefetched block of uniforms."""
+
+    def __init__(self, seed_seq, block_size=256):
+        self.seed_seq = seed_seq
+        self._gen = np.random.Generator(np.random.PCG64(seed_seq))
+        self._block_size = block_size
+        self._buffer = []
+        self._pos = 0
+
+    def random(self):
+        if self._pos == len(self._buffer):
+            self._buffer = self._gen.random(self._block_size).tolist()
+            self._pos = 0
+        value = self._buffer[self._pos]
+        self._pos += 1
+        return value
+
+    def randrange(self, n):
+        if n <= 0:
+            raise ValueError(f"empty range for randrange({n})")
+        if n > FLOAT_RANGE_LIMIT:
+            return self._randbelow_large(n)
+        return int(self.random() * n)
+
+    def _randbelow_large(self, n):
+        # Rejection sampling over just enough bits; each attempt succeeds with probability > 1/2.
+        bits = (n - 1).bit_length()
+        words = -(-bits // WORD_BITS)
+        while True:
+            value = 0
+            for word in self._gen.integers(0, 2 ** WORD_BITS, size=words).tolist():
+                value = (value << WORD_BITS) | word
+            value >>= words * WORD_BITS - bits
+            if value < n:
+                return value
+
+    def randint(self, a, b):
+        if a > b:
+            raise ValueError(f"empty range in randint({a}, {b})")
+        return a + self.randrange(b - a + 1)
+
+    def choice(self, seq):
+        return seq[self.randrange(len(seq))]
+
+    def shuffle(self, items):
+        for i in range(len(items) - 1, 0, -1):
+            j = self.randrange(i + 1)
+            items[i], items[j] = items[j], items[i]
+
+
+def new_root_seed():
+    return int(np.random.SeedSequence().entropy)
+
+
+def derive_stream(root_seed, *keys, block_size=256):
+    """Independent stream for `keys` under `root_seed`; same seed and keys give the same draws."""
+    spawn_key = tuple(zlib.crc32(str(key).encode("utf-8")) for key in keys)
+    return RandomStream(np.random.SeedSequence(root_seed, spawn_key=spawn_key), block_size=block_size)
+
+
+def deranged_shuffle(items, rng):
+    """Shuffle items so that no player receives their own submission."""
+    players = list(items.keys())
+    values = list(items.values())
+    n = len(players)
+    for _ in range(100):  # retry loop
+        shuffled_values = values[:]
+        rng.shuffle(shuffled_values)
+        if all(players[i] != shuffled_values[i][0] for i in range(n)):
+            return dict(zip(players, [v[1] for v in shuffled_values]))
+    # Fallback: simple rotation
+    return dict(zip(players, [v[1] for v in values[1:] + values[:1]]))
@@ -0,0 +1,50 @@
+import pytest
+
+from rng_streams import derive_stream, deranged_shuffle
+
+
+def draws(rng, k=50):
+    return [rng.random() for _ in range(k)]
+
+
+def test_same_seed_and_keys_give_same_draws():
+    assert draws(derive_stream(1234, "game", 1)) == draws(derive_stream(1234, "game", 1))
+
+
+def test_different_keys_give_independent_draws():
+    assert draws(derive_stream(1234, "game", 1)) != draws(derive_stream(1234, "game", 2))
+    assert draws(derive_stream(1234, "game", 1)) != draws(derive_stream(1234, "game", 1, "colors"))
+    assert draws(derive_stream(1234, "session")) != draws(derive_stream(4321, "session"))
+
+
+def test_draws_continue_across_prefetched_blocks():
+    small = derive_stream(7, "session", block_size=3)
+    assert draws(small, 10) == draws(derive_stream(7, "session"), 10)
+
+
+def test_deranged_shuffle_is_reproducible_from_seed():
+    items = {player: (player, str(i)) for i, player in enumerate(["a", "b", "c", "d", "e"])}
+    first = deranged_shuffle(items, derive_stream(99, 2, "draw"))
+    assert first == deranged_shuffle(items, derive_stream(99, 2, "draw"))
+    assert all(first[player] != items[player][1] for player in items)
+
+
+def test_randint_bounds():
+    rng = derive_stream(5, "session")
+    assert {rng.randint(1, 6) for _ in range(500)} == {1, 2, 3, 4, 5, 6}
+    assert rng.randint(3, 3) == 3
+    with pytest.raises(ValueError):
+        rng.randint(10, 5)
+
+
+def test_randint_large_range_uses_all_bits():
+    rng = derive_stream(5, "session")
+    assert any(rng.randint(0, 2 ** 60) % 2 for _ in range(100))
+
+
+def test_randint_beyond_64_bits():
+    rng = derive_stream(5, "session")
+    values = [rng.randint(0, 2 ** 70) for _ in range(100)]
+    assert all(0 <= value <= 2 ** 70 for value in values)
+    assert any(value >= 2 ** 64 for value in values)
+    assert any(value % 2 for value in values)